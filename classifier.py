@@ -0,0 +1,140 @@
+"""
+Hot per-card helpers: keyword classification and 'posted' date parsing.
+
+Kept free of scraper state and plain enough for Cython's pure-Python mode,
+so it can be compiled in place for extra speed:
+
+    pip install cython
+    cythonize -i classifier.py
+
+The compiled extension is picked up ahead of this file on import; delete
+the generated .so/.pyd to go back to the interpreted version.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import List, Optional, Tuple
+
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None  # type: ignore
+
+KEYWORDS = (
+    "ROS",
+    "ROS 2",
+    "robotics",
+    "autonomy",
+    "controls",
+    "control",
+    "reinforcement learning",
+    "rl",
+    "simulation",
+    "control theory",
+    "optimization",
+    "MPC",
+    "SLAM",
+    "navigation",
+    "state estimation",
+    "localization",
+    "Python",
+    "C++",
+    "machine learning",
+)
+
+_POSTED_RE = re.compile(r"(\d+)\s*(hour|day|week|month|year)s?\s+ago")
+
+# Keywords lowered once; the automaton (if available) finds all of them in one pass
+_KW_LOWER = tuple((kw, kw.lower()) for kw in KEYWORDS)
+_AUTOMATON = None
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _idx, (_, _kw_lower) in enumerate(_KW_LOWER):
+        _AUTOMATON.add_word(_kw_lower, _idx)
+    _AUTOMATON.make_automaton()
+
+# Fallback: one alternation scanned at every offset (lookahead), longest keyword first.
+# A hit also implies every keyword that is a prefix of it (e.g. "ros 2" -> "ros").
+_BY_LENGTH = sorted(_KW_LOWER, key=lambda kw: len(kw[1]), reverse=True)
+_KW_REGEX = re.compile("(?=(" + "|".join(re.escape(kw_lower) for _, kw_lower in _BY_LENGTH) + "))")
+_KW_IMPLIED = {
+    kw_lower: frozenset(idx for idx, (_, other) in enumerate(_KW_LOWER) if kw_lower.startswith(other))
+    for _, kw_lower in _KW_LOWER
+}
+
+
+def classify_job(title: str, description: str, role_keyword: str) -> Tuple[int, List[str]]:
+    """Return (fit score 0-100, matched keyword tags) for a job posting."""
+    title_hit = role_keyword.lower() in title.lower()
+
+    # Newline can't occur in any keyword, so no match can straddle title and description
+    haystack = f"{title or ''}\n{description or ''}".lower()
+
+    # Tags are exported, so the scan stays exhaustive; it only stops once every keyword is found
+    found = set()
+    total = len(_KW_LOWER)
+    if _AUTOMATON is not None:
+        for _, idx in _AUTOMATON.iter(haystack):
+            found.add(idx)
+            if len(found) == total:
+                break
+    else:
+        for match in _KW_REGEX.finditer(haystack):
+            found |= _KW_IMPLIED[match.group(1)]
+            if len(found) == total:
+                break
+
+    tags = [_KW_LOWER[idx][0] for idx in sorted(found)]
+    score = min(40 * title_hit + 5 * len(tags), 100)
+    return score, tags
+
+
+@functools.lru_cache(maxsize=256)
+def parse_posted_days(text: str) -> Optional[int]:
+    """
+    Convert LinkedIn 'posted' text like:
+    - '6 days ago'
+    - '2 weeks ago'
+    - '3 hours ago'
+    - 'Just now'
+    - 'Today'
+    - 'Yesterday'
+    to integer days.
+
+    Returns None if unknown/unparseable. Memoized: LinkedIn only emits a
+    handful of distinct strings, so nearly every call is a cache hit.
+    """
+    if not text:
+        return None
+
+    t = text.strip().lower()
+
+    if t == "just now":
+        return 0
+    if t == "today":
+        return 0
+    if t == "yesterday":
+        return 1
+
+    # Common: "X days ago", "X weeks ago", "X hours ago"
+    m = _POSTED_RE.search(t)
+    if not m:
+        return None
+
+    value = int(m.group(1))
+    unit = m.group(2)
+
+    if unit == "hour":
+        return 0
+    if unit == "day":
+        return value
+    if unit == "week":
+        return value * 7
+    if unit == "month":
+        return value * 30
+    if unit == "year":
+        return value * 365
+
+    return None
@@ -2,26 +2,31 @@ from __future__ import annotations
 
 import os
 import re
-import time
+import random
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 
+import classifier
+
 try:
-    import gspread  # type: ignore
     from google.oauth2.service_account import Credentials  # type: ignore
+    from googleapiclient.discovery import build as build_google_service  # type: ignore
 except Exception:
-    gspread = None  # type: ignore
     Credentials = None  # type: ignore
+    build_google_service = None  # type: ignore
 
 try:
-    from notion_client import Client as NotionClient  # type: ignore
+    import lxml  # type: ignore  # noqa: F401
+
+    HTML_PARSER = "lxml"
 except Exception:
-    NotionClient = None  # type: ignore
+    HTML_PARSER = "html.parser"
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
@@ -31,11 +36,100 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+_AGO_RE = re.compile(r"\bago\b")
+_JOB_CARD_CLASS_RE = re.compile("job-card|result")
+_POSTED_SET = frozenset({"just now", "today", "yesterday"})
+# Cards are <li> (or <div class="job-card...">); nothing outside them is materialized
+_CARD_STRAINER = SoupStrainer(["li", "div"])
+
+COLUMNS = (
+    "role_keyword",
+    "title",
+    "company",
+    "location",
+    "posted",
+    "posted_days",
+    "link",
+    "description",
+    "fit_score",
+    "tags",
+    "scraped_at_utc",
+)
+
+RETRY_STATUSES = frozenset({429, 503})
+MAX_BACKOFF = 60.0
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry `attempt + 1`: Retry-After if numeric, else jittered 2**attempt."""
+    if retry_after:
+        try:
+            return min(MAX_BACKOFF, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(MAX_BACKOFF, 2.0**attempt + random.random())
+
+
+class TokenBucket:
+    """Async token bucket: refills `rate` tokens per second, holds at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at: Optional[float] = None
+
+    async def acquire(self) -> None:
+        """Wait (without blocking the event loop) until a token is available, then take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if self._updated_at is not None:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # No await between the check and the decrement, so this is safe without a lock
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+NOTION_PAGES_URL = "https://api.notion.com/v1/pages"
+NOTION_VERSION = "2022-06-28"
+
+
+def _notion_payload(row: Dict[str, object], database_id: str) -> Dict[str, object]:
+    """Build the JSON body for POST /v1/pages from one scraped job row."""
+    name = f"{row['title']} @ {row['company']}"
+    properties = {
+        "Name": {"title": [{"text": {"content": name}}]},
+        "Role Keyword": {"rich_text": [{"text": {"content": str(row["role_keyword"])}}]},
+        "Company": {"rich_text": [{"text": {"content": str(row["company"])}}]},
+        "Location": {"rich_text": [{"text": {"content": str(row["location"])}}]},
+        "Posted": {"rich_text": [{"text": {"content": str(row.get("posted", ""))}}]},
+        "Link": {"url": str(row.get("link", ""))},
+        "Fit Score": {"number": int(row.get("fit_score", 0))},
+        "Tags": {
+            "multi_select": [{"name": t.strip()} for t in str(row.get("tags", "")).split(",") if t.strip()]
+        },
+        "Description": {
+            "rich_text": [{"text": {"content": str(row.get("description", ""))[:2000]}}]
+        },
+    }
+    return {"parent": {"database_id": database_id}, "properties": properties}
+
 
 class LinkedInScraper:
     """Scrape LinkedIn job postings for specified roles and locations."""
 
     BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    MAX_CONCURRENCY = 8  # in-flight requests per host
+    MAX_CONNECTIONS = 16  # pooled keep-alive connections overall
+    MAX_RETRIES = 5  # attempts per page on 429/503/connection errors
+    BURST = 2  # requests allowed back-to-back after an idle period
+    NOTION_CONCURRENCY = 3
+    NOTION_RATE = 3.0  # requests per second
+    NOTION_MAX_RETRIES = 5
 
     def __init__(
         self,
@@ -50,7 +144,7 @@ class LinkedInScraper:
         roles: Role keywords to search for.
         location: Location string used to filter jobs.
         pages: Number of pages per role (each page ~25 cards).
-        pause: Seconds between requests (safety throttle). Enforced minimum = 2.0.
+        pause: Average seconds between requests (safety throttle). Enforced minimum = 2.0.
         proxy: Optional proxy URL.
         max_posted_days: Drop jobs older than this many days.
         """
@@ -60,19 +154,17 @@ class LinkedInScraper:
         self.pause = max(2.0, float(pause))
         self.max_posted_days = int(max_posted_days)
 
-        self.session = requests.Session()
-        if proxy:
-            self.session.proxies.update({"http": proxy, "https": proxy})
-
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-            }
-        )
+        self.proxy = proxy
+        self.headers = {
+            "User-Agent": (
+                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+
+        # Links already parsed during the current scrape() call
+        self._seen_links: set[str] = set()
 
     # -----------------------------
     # Scraping
@@ -83,63 +175,135 @@ class LinkedInScraper:
         role_keyword, title, company, location, posted, posted_days, link,
         description, fit_score, tags, scraped_at_utc
         """
-        all_jobs: List[Dict[str, object]] = []
+        columns: Dict[str, List[object]] = {col: [] for col in COLUMNS}
         scraped_at = datetime.now(timezone.utc).isoformat()
+        self._seen_links = set()
 
-        for role in self.roles:
-            logger.info(f"Scraping role: {role}")
-            jobs = self._scrape_role(role, scraped_at_utc=scraped_at)
-            all_jobs.extend(jobs)
+        # Network stage: fetch every (role, page) concurrently
+        fetched = asyncio.run(self._fetch_pages_async())
 
-        df = pd.DataFrame(all_jobs)
+        # CPU stage: parse in-process, in role/page order (~18 ms/page vs >= 2 s fetch spacing)
+        for role, body, encoding in fetched:
+            result = self._parse_page(role, body, encoding, scraped_at)
+            for col, values in result.items():
+                columns[col].extend(values)
+
+        # Build column-wise; posted_days becomes nullable Int64 in one conversion
+        columns["posted_days"] = pd.array(columns["posted_days"], dtype="Int64")
+        df = pd.DataFrame(columns, copy=False)
+        df["fit_score"] = df["fit_score"].astype("int32")
 
         if df.empty:
             return df
 
-        # Drop duplicates by link
-        if "link" in df.columns:
-            df = df.drop_duplicates(subset=["link"])
+        # Cards with a known link were deduplicated while parsing; this catches link-less ones
+        df = df.drop_duplicates(subset=["link"])
 
-        # Keep only jobs with a parsable age <= max_posted_days
-        if "posted_days" in df.columns:
-            df = df[(df["posted_days"].isna()) | (df["posted_days"] <= self.max_posted_days)]
+        # Keep only jobs with a parsable age <= max_posted_days (typed columns -> vectorized compare)
+        df = df[df["posted_days"].isna() | (df["posted_days"] <= self.max_posted_days)]
 
         # Sort: newest first, then score
-        if "posted_days" in df.columns and "fit_score" in df.columns:
-            df = df.sort_values(by=["posted_days", "fit_score"], ascending=[True, False])
+        df = df.sort_values(by=["posted_days", "fit_score"], ascending=[True, False])
 
         return df.reset_index(drop=True)
 
-    def _scrape_role(self, role: str, scraped_at_utc: str) -> List[Dict[str, object]]:
-        jobs: List[Dict[str, object]] = []
+    async def _fetch_pages_async(self) -> List[Tuple[str, bytes, Optional[str]]]:
+        """Fetch all result pages; returns (role, body, charset) for each page that succeeded."""
+        # One token per `pause` seconds; capacity 2 allows a short burst after idle
+        bucket = TokenBucket(rate=1.0 / self.pause, capacity=self.BURST)
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        pages = [(role, page) for role in self.roles for page in range(self.pages)]
+        for role in self.roles:
+            logger.info(f"Scraping role: {role}")
+
+        # One pooled, keep-alive connector for the whole run so TLS setup is paid once per socket
+        connector = aiohttp.TCPConnector(
+            limit=self.MAX_CONNECTIONS,
+            limit_per_host=self.MAX_CONCURRENCY,
+            keepalive_timeout=max(30.0, self.pause * 2),
+        )
+        timeout = aiohttp.ClientTimeout(total=15)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=self.headers
+        ) as session:
+            results = await asyncio.gather(
+                *(self._fetch_page_async(role, page, session, sem, bucket) for role, page in pages),
+                return_exceptions=True,
+            )
+
+        # gather() preserves task order, so pages stay grouped by role then page
+        fetched: List[Tuple[str, bytes, Optional[str]]] = []
+        for (role, page), result in zip(pages, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping {role} page {page + 1}: {result}")
+                continue
+            if result is not None:
+                body, encoding = result
+                fetched.append((role, body, encoding))
 
-        for page in range(self.pages):
-            start = page * 25
-            params = {"keywords": role, "location": self.location, "start": start}
+        return fetched
 
-            try:
-                resp = self.session.get(self.BASE_URL, params=params, timeout=15)
-                if resp.status_code != 200:
+    async def _fetch_page_async(
+        self,
+        role: str,
+        page: int,
+        session: aiohttp.ClientSession,
+        sem: asyncio.Semaphore,
+        bucket: TokenBucket,
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        params = {"keywords": role, "location": self.location, "start": page * 25}
+
+        for attempt in range(self.MAX_RETRIES):
+            retry_after: Optional[str] = None
+            async with sem:
+                await bucket.acquire()
+                try:
+                    async with session.get(self.BASE_URL, params=params, proxy=self.proxy) as resp:
+                        if resp.status == 200:
+                            # Hand the parser raw bytes plus the declared charset (None lets bs4 detect it)
+                            return await resp.read(), resp.charset
+                        if resp.status not in RETRY_STATUSES:
+                            logger.warning(
+                                f"Received status {resp.status} for role {role} page {page + 1}"
+                            )
+                            return None
+                        retry_after = resp.headers.get("Retry-After")
+                        logger.warning(
+                            f"Received status {resp.status} for role {role} page {page + 1} "
+                            f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+                        )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
                     logger.warning(
-                        f"Received status {resp.status_code} for role {role} page {page + 1}"
+                        f"Error fetching jobs for {role} page {page + 1} "
+                        f"(attempt {attempt + 1}/{self.MAX_RETRIES}): {exc}"
                     )
-                    break
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                cards = soup.find_all("li")
-                if not cards:
-                    cards = soup.find_all("div", class_=re.compile("job-card|result"))
+            # Back off outside the semaphore so other pages can use the slot meanwhile
+            if attempt < self.MAX_RETRIES - 1:
+                await asyncio.sleep(_backoff_delay(attempt, retry_after))
 
-                for card in cards:
-                    job = self._parse_job_card(card, role, scraped_at_utc=scraped_at_utc)
-                    if job:
-                        jobs.append(job)
+        logger.error(f"Giving up on role {role} page {page + 1} after {self.MAX_RETRIES} attempts")
+        return None
+
+    def _parse_page(
+        self, role: str, body: bytes, encoding: Optional[str], scraped_at_utc: str
+    ) -> Dict[str, List[object]]:
+        """Parse one fetched result page into per-column lists."""
+        jobs: Dict[str, List[object]] = {col: [] for col in COLUMNS}
 
-                time.sleep(self.pause)
+        soup = BeautifulSoup(
+            body, HTML_PARSER, parse_only=_CARD_STRAINER, from_encoding=encoding
+        )
+        cards = soup.find_all("li")
+        if not cards:
+            cards = soup.find_all("div", class_=_JOB_CARD_CLASS_RE)
 
-            except requests.RequestException as exc:
-                logger.error(f"Error fetching jobs for {role}: {exc}")
-                break
+        for card in cards:
+            job = self._parse_job_card(card, role, scraped_at_utc=scraped_at_utc)
+            if job:
+                for col in COLUMNS:
+                    jobs[col].append(job[col])
 
         return jobs
 
@@ -151,26 +315,37 @@ class LinkedInScraper:
         Returns None if essential fields cannot be found.
         """
         try:
+            # Collect every element we need in one walk of the card subtree
+            title_elem = company_elem = link_tag = desc_elem = None
+            metadata = []
+            for node in element.descendants:
+                name = node.name
+                if name == "span":
+                    metadata.append(node)
+                elif name == "h3" and title_elem is None:
+                    title_elem = node
+                elif name == "h4" and company_elem is None:
+                    company_elem = node
+                elif name == "a" and link_tag is None and node.get("href") is not None:
+                    link_tag = node
+                elif name == "p" and desc_elem is None:
+                    desc_elem = node
+
             # Title
-            title_elem = element.find("h3")
             title = title_elem.get_text(strip=True) if title_elem else ""
 
             # Company
-            company_elem = element.find("h4")
             company = company_elem.get_text(strip=True) if company_elem else ""
 
             # Location + "posted" text
-            metadata = element.find_all("span")
             location = ""
             posted_text = ""
 
             for span in metadata:
                 text = span.get_text(strip=True)
-                if re.search(r"\bago\b", text.lower()) or text.lower() in {
-                    "just now",
-                    "today",
-                    "yesterday",
-                }:
+                text_lower = text.lower()
+                # Cheap substring check first; most spans never reach the regex
+                if ("ago" in text_lower and _AGO_RE.search(text_lower)) or text_lower in _POSTED_SET:
                     posted_text = text
                 elif not location:
                     location = text
@@ -179,7 +354,6 @@ class LinkedInScraper:
 
             # Link to job posting (robust)
             link = ""
-            link_tag = element.find("a", href=True)
             if link_tag:
                 href = link_tag["href"].strip()
                 if href.startswith("http"):
@@ -190,9 +364,14 @@ class LinkedInScraper:
                 # Remove tracking params for stable dedup keys
                 link = link.split("?")[0]
 
+            # Skip cards already seen on another page/role before doing any more work
+            if link:
+                if link in self._seen_links:
+                    return None
+                self._seen_links.add(link)
+
             # Description snippet (guest endpoint gives short snippet)
             desc = ""
-            desc_elem = element.find("p")
             if desc_elem:
                 desc = desc_elem.get_text(" ", strip=True)
 
@@ -218,94 +397,14 @@ class LinkedInScraper:
             logger.debug(f"Failed to parse job card: {exc}")
             return None
 
-    def _parse_posted_days(self, text: str) -> Optional[int]:
-        """
-        Convert LinkedIn 'posted' text like:
-        - '6 days ago'
-        - '2 weeks ago'
-        - '3 hours ago'
-        - 'Just now'
-        - 'Today'
-        - 'Yesterday'
-        to integer days.
-
-        Returns None if unknown/unparseable.
-        """
-        if not text:
-            return None
-
-        t = text.strip().lower()
-
-        if t == "just now":
-            return 0
-        if t == "today":
-            return 0
-        if t == "yesterday":
-            return 1
-
-        # Common: "X days ago", "X weeks ago", "X hours ago"
-        m = re.search(r"(\d+)\s*(hour|day|week|month|year)s?\s+ago", t)
-        if not m:
-            return None
-
-        value = int(m.group(1))
-        unit = m.group(2)
-
-        if unit == "hour":
-            return 0
-        if unit == "day":
-            return value
-        if unit == "week":
-            return value * 7
-        if unit == "month":
-            return value * 30
-        if unit == "year":
-            return value * 365
-
-        return None
+    # Compiled-friendly helpers live in classifier.py
+    _parse_posted_days = staticmethod(classifier.parse_posted_days)
 
     # -----------------------------
     # Classification
     # -----------------------------
     def classify_job(self, title: str, description: str, role_keyword: str) -> Tuple[int, List[str]]:
-        tags: List[str] = []
-        score = 0
-
-        if role_keyword.lower() in title.lower():
-            score += 40
-
-        keywords = [
-            "ROS",
-            "ROS 2",
-            "robotics",
-            "autonomy",
-            "controls",
-            "control",
-            "reinforcement learning",
-            "rl",
-            "simulation",
-            "control theory",
-            "optimization",
-            "MPC",
-            "SLAM",
-            "navigation",
-            "state estimation",
-            "localization",
-            "Python",
-            "C++",
-            "machine learning",
-        ]
-
-        desc_lower = (description or "").lower()
-        title_lower = (title or "").lower()
-
-        for kw in keywords:
-            if kw.lower() in title_lower or kw.lower() in desc_lower:
-                tags.append(kw)
-                score += 5
-
-        score = min(score, 100)
-        return score, tags
+        return classifier.classify_job(title, description, role_keyword)
 
     # -----------------------------
     # Export functions
@@ -323,10 +422,10 @@ class LinkedInScraper:
           - Google Sheets API enabled in the GCP project.
           - Sheet shared with the service account email.
         """
-        if gspread is None or Credentials is None:
+        if Credentials is None or build_google_service is None:
             raise ImportError(
-                "gspread/google-auth not installed. "
-                "Run: pip install gspread google-auth"
+                "google-api-python-client/google-auth not installed. "
+                "Run: pip install google-api-python-client google-auth"
             )
 
         creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
@@ -338,74 +437,89 @@ class LinkedInScraper:
             scopes=SCOPES,
         )
 
-        client = gspread.authorize(creds)
-        sheet = client.open_by_key(sheet_id)
+        service = build_google_service("sheets", "v4", credentials=creds, cache_discovery=False)
+        spreadsheets = service.spreadsheets()
 
         # Ensure worksheet exists
-        try:
-            worksheet = sheet.worksheet(worksheet_name)
-        except Exception:
-            worksheet = sheet.add_worksheet(title=worksheet_name, rows="1000", cols="30")
+        meta = spreadsheets.get(spreadsheetId=sheet_id, fields="sheets.properties.title").execute()
+        titles = {ws["properties"]["title"] for ws in meta.get("sheets", [])}
+        if worksheet_name not in titles:
+            spreadsheets.batchUpdate(
+                spreadsheetId=sheet_id,
+                body={
+                    "requests": [
+                        {
+                            "addSheet": {
+                                "properties": {
+                                    "title": worksheet_name,
+                                    "gridProperties": {"rowCount": 1000, "columnCount": 30},
+                                }
+                            }
+                        }
+                    ]
+                },
+            ).execute()
+
+        # Build rows (header only when there is nothing to write)
+        if df.empty:
+            values = [list(COLUMNS)]
+        else:
+            # Straight to Python objects with NA -> "", no intermediate filled copy of the frame
+            rows = df.to_numpy(dtype=object, na_value="").tolist()
+            values = [list(df.columns)] + rows
+
+        # Overwrite sheet contents each run: one clear + one batched write
+        # A1 notation: quote the sheet name and double any single quotes inside it
+        quoted_name = worksheet_name.replace("'", "''")
+        sheet_range = f"'{quoted_name}'"
+        spreadsheets.values().clear(spreadsheetId=sheet_id, range=sheet_range, body={}).execute()
+        spreadsheets.values().update(
+            spreadsheetId=sheet_id,
+            range=f"{sheet_range}!A1",
+            valueInputOption="USER_ENTERED",
+            body={"values": values},
+        ).execute()
 
-        # Build rows
         if df.empty:
-            # Clear sheet but keep header (optional)
-            worksheet.clear()
-            worksheet.append_row(
-                [
-                    "role_keyword",
-                    "title",
-                    "company",
-                    "location",
-                    "posted",
-                    "posted_days",
-                    "link",
-                    "description",
-                    "fit_score",
-                    "tags",
-                    "scraped_at_utc",
-                ]
-            )
             logger.info(f"No jobs to write. Cleared worksheet {worksheet_name} and wrote header.")
             return
 
-        df_out = df.copy()
-
-        # Overwrite sheet contents each run
-        worksheet.clear()
-        worksheet.append_row(list(df_out.columns))
-        rows = df_out.fillna("").values.tolist()
-        worksheet.append_rows(rows, value_input_option="USER_ENTERED")
-
         logger.info(
             f"Overwrote worksheet '{worksheet_name}' with {len(rows)} rows "
             f"(filtered to <= {self.max_posted_days} days old)."
         )
 
     def push_to_notion(self, df: pd.DataFrame, notion_token: str, database_id: str) -> None:
-        if NotionClient is None:
-            raise ImportError("notion-client not installed. Run: pip install notion-client")
-
-        notion = NotionClient(auth=notion_token)
-        for _, row in df.iterrows():
-            properties = {
-                "Name": {
-                    "title": [{"text": {"content": f"{row['title']} @ {row['company']}"}}]
-                },
-                "Role Keyword": {"rich_text": [{"text": {"content": str(row["role_keyword"])}}]},
-                "Company": {"rich_text": [{"text": {"content": str(row["company"])}}]},
-                "Location": {"rich_text": [{"text": {"content": str(row["location"])}}]},
-                "Posted": {"rich_text": [{"text": {"content": str(row.get("posted", ""))}}]},
-                "Link": {"url": str(row.get("link", ""))},
-                "Fit Score": {"number": int(row.get("fit_score", 0))},
-                "Tags": {
-                    "multi_select": [{"name": t.strip()} for t in str(row.get("tags", "")).split(",") if t.strip()]
-                },
-                "Description": {
-                    "rich_text": [{"text": {"content": str(row.get("description", ""))[:2000]}}]
-                },
-            }
-            notion.pages.create(parent={"database_id": database_id}, properties=properties)
-            time.sleep(0.3)
-
+        asyncio.run(self._push_to_notion_async(df, notion_token, database_id))
         logger.info(f"Inserted {len(df)} rows into Notion database")
+
+    async def _push_to_notion_async(self, df: pd.DataFrame, notion_token: str, database_id: str) -> None:
+        sem = asyncio.Semaphore(self.NOTION_CONCURRENCY)
+        # Notion allows ~3 req/s on average
+        bucket = TokenBucket(rate=self.NOTION_RATE)
+
+        async def create_page(session: aiohttp.ClientSession, row: Dict[str, object]) -> None:
+            payload = _notion_payload(row, database_id)
+
+            async with sem:
+                for attempt in range(self.NOTION_MAX_RETRIES):
+                    await bucket.acquire()
+                    async with session.post(NOTION_PAGES_URL, json=payload) as resp:
+                        if resp.status != 429 or attempt == self.NOTION_MAX_RETRIES - 1:
+                            resp.raise_for_status()
+                            return
+                        retry_after = resp.headers.get("Retry-After")
+                    delay = _backoff_delay(attempt, retry_after)
+                    logger.warning(f"Notion rate limited, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+
+        headers = {
+            "Authorization": f"Bearer {notion_token}",
+            "Notion-Version": NOTION_VERSION,
+        }
+        records = df.astype(object).fillna("").to_dict("records")
+        async with aiohttp.ClientSession(
+            headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+        ) as session:
+            await asyncio.gather(*(create_page(session, row) for row in records))
+
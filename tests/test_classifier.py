@@ -0,0 +1,45 @@
+import unittest
+from unittest import mock
+
+import classifier
+
+# Overlapping keywords: prefixes of each other ("ros"/"ros 2", "control"/"controls"/"control theory")
+# and short substrings of longer words ("rl" in "world").
+OVERLAPPING_INPUTS = [
+    ("Robotics Engineer", "Experience with ROS 2 required", "Robotics Engineer"),
+    ("Controls Engineer", "Background in control theory", "Controls Engineer"),
+    ("Autonomy Engineer", "controls, ros2, world-class C++", "Robotics Engineer"),
+    ("ROS", "", "ROS"),
+    ("", "control theory controls ros 2 ros", "x"),
+]
+
+
+def _baseline_classify(title, description, role_keyword):
+    """The original per-keyword substring loop the fast paths must reproduce."""
+    tags = []
+    score = 40 if role_keyword.lower() in title.lower() else 0
+    for kw in classifier.KEYWORDS:
+        if kw.lower() in title.lower() or kw.lower() in description.lower():
+            tags.append(kw)
+            score += 5
+    return min(score, 100), tags
+
+
+class ClassifyJobTest(unittest.TestCase):
+    def test_regex_fallback_matches_baseline(self):
+        with mock.patch.object(classifier, "_AUTOMATON", None):
+            for args in OVERLAPPING_INPUTS:
+                with self.subTest(args=args):
+                    self.assertEqual(classifier.classify_job(*args), _baseline_classify(*args))
+
+    @unittest.skipIf(classifier._AUTOMATON is None, "pyahocorasick not installed")
+    def test_automaton_matches_regex_fallback(self):
+        for args in OVERLAPPING_INPUTS:
+            with self.subTest(args=args):
+                with_automaton = classifier.classify_job(*args)
+                with mock.patch.object(classifier, "_AUTOMATON", None):
+                    self.assertEqual(classifier.classify_job(*args), with_automaton)
+
+
+if __name__ == "__main__":
+    unittest.main()